@@ -10,32 +10,44 @@ import os
 import sys
 import subprocess
 import datetime
+import io
 import random
+import re
 import json
-import pickle
+import hashlib
+import email.utils
+import sqlite3
+import threading
+import time
+import functools
+import importlib.util
+from contextlib import closing
 from pathlib import Path
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 
-import feedparser
 import requests
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import (
-    BaseDocTemplate,
-    PageTemplate,
-    Frame,
-    Paragraph,
-    Spacer
-)
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch, cm
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
-from bs4 import BeautifulSoup
-import html2text
-from babel.dates import format_date
 import locale
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.pdfgen import canvas
+
+# feedparser, bs4, babel, reportlab and openai are imported where they are used,
+# so the first network request isn't held up by loading them at startup
+
+try:
+    import orjson  # Optional, much faster JSON decoding and encoding
+    json_loads = orjson.loads
+
+    def json_dumps(obj):
+        """Serialize obj to a JSON string, with non-ASCII text kept as-is."""
+        return orjson.dumps(obj).decode()
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        """Serialize obj to a JSON string, with non-ASCII text kept as-is."""
+        return json.dumps(obj, ensure_ascii=False)
 
 load_dotenv()  # Load environment variables from .env file
 
@@ -45,10 +57,29 @@ load_dotenv()  # Load environment variables from .env file
 
 # Hacker News
 HN_TOP_STORIES_URL = "https://hacker-news.firebaseio.com/v0/topstories.json"
+HN_ITEM_URL = "https://hacker-news.firebaseio.com/v0/item/{}.json"
+HN_SEARCH_URL = "https://hn.algolia.com/api/v1/search"  # Algolia, many stories per request
+HN_WORKERS = 8  # Max concurrent Hacker News item/article fetches
+HN_CANDIDATE_FACTOR = 6  # Consider at most this many top stories per story wanted
+ARTICLE_MAX_BYTES = 200_000  # Max bytes of each article page downloaded
+ARTICLE_MIN_LINE_CHARS = 40  # Shorter article lines are kept only if they end a sentence
+SENTENCE_ENDINGS = (".", "!", "?", "…", "»", '"')
+URL_RE = re.compile(r"\s*https?://\S+")
+
+# HTML text extraction: elements that never hold article text, and the fast
+# C-based parsers when they are installed (selectolax, else lxml for BeautifulSoup)
+NON_CONTENT_TAGS = ["script", "style", "nav", "header", "footer", "aside"]
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+USE_SELECTOLAX = importlib.util.find_spec("selectolax") is not None
+USE_TRAFILATURA = importlib.util.find_spec("trafilatura") is not None  # Article main-content extraction
+# Whitespace between chunks of extracted text: a run holding a line break (any
+# that str.splitlines() breaks on) or two spaces, which separate multi-headlines
+TEXT_BREAK_RE = re.compile(r"\s*(?:[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]|  )\s*")
 
 # RSS Feeds and News Sites
 RTS_URL = "https://www.rts.ch/"
 LE_TEMPS_RSS = "https://www.letemps.ch/articles.rss"
+RSS_TTL = 600  # Feeds are revalidated with a conditional GET after 10 minutes
 
 # Weather: Open-Meteo API
 CITY_NAME = "Morges"  # City name for display purposes
@@ -59,10 +90,33 @@ WEATHER_URL = (
     f"latitude={MORGES_LAT}&longitude={MORGES_LON}"
     f"&current=temperature_2m,weather_code"
 )
+WEATHER_TTL = 600  # Current conditions change slowly, reuse them for 10 minutes
+
+# WMO Weather interpretation codes (https://open-meteo.com/en/docs), read-only
+WEATHER_DESCRIPTIONS = MappingProxyType({
+    0: "Clear sky",
+    1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
+    45: "Foggy", 48: "Depositing rime fog",
+    51: "Light drizzle", 53: "Moderate drizzle", 55: "Dense drizzle",
+    61: "Slight rain", 63: "Moderate rain", 65: "Heavy rain",
+    71: "Slight snow", 73: "Moderate snow", 75: "Heavy snow",
+    77: "Snow grains",
+    80: "Slight rain showers", 81: "Moderate rain showers", 82: "Violent rain showers",
+    85: "Slight snow showers", 86: "Heavy snow showers",
+    95: "Thunderstorm", 96: "Thunderstorm with hail", 99: "Thunderstorm with heavy hail"
+})
 
 # (Optional) OpenAI Summarization
 USE_OPENAI_SUMMARY = True
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")  # Get from environment variable
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")  # Small model is plenty for summaries
+SUMMARY_MODEL = os.getenv("SUMMARY_MODEL", OPENAI_MODEL)  # Model for summaries and translations
+OPENAI_MAX_CONCURRENCY = 4  # Max OpenAI calls in flight at once
+OPENAI_MAX_RETRIES = 4  # Rate-limited and failed calls are retried with exponential backoff
+OPENAI_RETRY_DELAY = 1  # Seconds before the first retry, doubled for each next one
+OPENAI_MAX_RETRY_AFTER = 60  # Longer Retry-After values are ignored in favor of the backoff
+OPENAI_TIMEOUT = 30  # Seconds per API attempt, instead of the SDK's 10 minutes
+OPENAI_FALLBACK_MODEL = os.getenv("OPENAI_FALLBACK_MODEL", "gpt-4.1-nano")  # Faster model used once a call times out
 
 # Printer Name (for 'lpr')
 PRINTER_NAME = ""  # e.g., "EPSON_XXXX" or leave blank for default
@@ -73,20 +127,31 @@ PDF_PREFIX = "morning_press"
 # Max number of items to fetch per source
 MAX_ITEMS = 5
 
+# Browser-like User-Agent sent with every HTTP request
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Max number of sources fetched concurrently
+FETCH_WORKERS = 6
+
 # Default language for summaries
 DEFAULT_LANGUAGE = "french"
 
 # Summary configuration
-SUMMARY_MAX_TOKENS = 300  # Increased from 150
+SUMMARY_MAX_TOKENS = 200  # Generation time grows with output length, keep summaries short
+SHORT_REPLY_MAX_TOKENS = 120  # Quote translations and daily boost lines are a sentence or two
 SUMMARY_TEMPERATURE = 0.5  # Reduced for more focused summaries
+SUMMARY_MIN_CHARS = 200  # Shorter texts are used as-is, summarizing them gains nothing
+SUMMARY_MIN_WORDS = 30
+HN_MAX_INPUT_TOKENS = 1000  # Article text sent for each Hacker News summary, plenty for ~100 words
+RSS_MAX_INPUT_TOKENS = 600  # RSS descriptions are short, cap them tighter
 
 # Set locale for date formatting
 try:
     locale.setlocale(locale.LC_TIME, 'fr_FR.UTF-8')
-except:
+except locale.Error:
     try:
         locale.setlocale(locale.LC_TIME, 'fr_FR')
-    except:
+    except locale.Error:
         print("[WARN] Could not set French locale, falling back to default")
 
 # Fallback quotes in French
@@ -125,8 +190,19 @@ FALLBACK_QUOTES = [
     }
 ]
 
-# ZenQuotes API
-ZENQUOTES_API_URL = "https://zenquotes.io/api/random"
+# ZenQuotes API: a batch of quotes, downloaded once a week and picked from locally
+ZENQUOTES_API_URL = "https://zenquotes.io/api/quotes"
+ZENQUOTES_TTL = 7 * 24 * 3600
+
+# Offline quote translation with Argos Translate, used instead of OpenAI when it
+# is installed along with the English to target language model
+USE_ARGOS_TRANSLATE = importlib.util.find_spec("argostranslate") is not None
+ARGOS_LANGUAGE_CODES = MappingProxyType({
+    "french": "fr",
+    "german": "de",
+    "italian": "it",
+    "spanish": "es"
+})
 
 # Add to the configuration section
 AFFIRMATIONS_CATEGORIES = [
@@ -138,6 +214,18 @@ AFFIRMATIONS_CATEGORIES = [
     "health"
 ]
 
+# Topics the daily motivational quote is drawn from
+MOTIVATION_TOPICS = (
+    "success",
+    "perseverance",
+    "growth",
+    "wisdom",
+    "courage",
+    "creativity",
+    "happiness",
+    "inner peace"
+)
+
 FALLBACK_AFFIRMATIONS = [
     "Je suis capable de réaliser de grandes choses aujourd'hui.",
     "Chaque jour, je deviens une meilleure version de moi-même.",
@@ -151,103 +239,645 @@ FALLBACK_AFFIRMATIONS = [
     "Je crée ma propre réalité positive."
 ]
 
-# Register emoji font if available
-try:
-    # Try different possible paths for the Noto Color Emoji font
-    emoji_font_paths = [
-        "/System/Library/Fonts/Apple Color Emoji.ttc",  # macOS
-        "/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf",  # Linux
-        "C:/Windows/Fonts/seguiemj.ttf",  # Windows
-    ]
-    
-    for font_path in emoji_font_paths:
-        if os.path.exists(font_path):
-            pdfmetrics.registerFont(TTFont('EmojiFont', font_path))
-            break
-except Exception as e:
-    print(f"[WARN] Could not register emoji font: {e}")
-
 # Add to configuration section
 SECTION_SEPARATOR = "*" * 20
 
+# Paragraphs with characters above U+1F300 (pictographs, emoji) use the emoji font
+EMOJI_RE = re.compile("[\U0001F301-\U0010FFFF]")
+
 # Add to configuration section
 CACHE_DIR = "cache"
-CACHE_FILE = "news_cache.pkl"
+CACHE_FILE = "news_{date}.json"  # Source data fetched on a day, dated YYYYMMDD
+SUMMARY_CACHE_FILE = "summaries.sqlite"
+HTTP_CACHE_FILE = "http.sqlite"
+HTTP_CACHE_MAX_AGE = ZENQUOTES_TTL  # Responses not fetched within the longest TTL are dropped
+SUMMARY_CACHE_TTL = 24 * 3600  # Summaries are regenerated after a day
+# Stories are keyed on their summary settings; the older hn_stories.sqlite,
+# keyed on language only, is left unused
+HN_STORY_CACHE_FILE = "hn_summaries.sqlite"
+HN_STORY_CACHE_DAYS = 7  # Forget processed Hacker News stories after a week
+
+# How long cached HTTP responses are reused before revalidating (seconds)
+HN_TOP_STORIES_TTL = 300
+HN_ITEM_TTL = 3600
+
+# (connect, read) timeouts: fail fast on unreachable hosts, allow slower responses
+HTTP_TIMEOUT = (3.05, 7)
 
-def save_to_cache(content):
-    """Save content to cache file."""
+# Shared HTTP session so TCP/TLS connections are reused across all fetches;
+# only idempotent requests are retried, briefly, so a flaky host can't stall the run
+SESSION = requests.Session()
+SESSION.headers["User-Agent"] = USER_AGENT
+_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"GET", "HEAD"})
+    )
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+def save_to_cache(data):
+    """Save the day's fetched source data to a JSON file in the cache directory."""
     cache_path = Path(CACHE_DIR)
     cache_path.mkdir(exist_ok=True)
     
-    cache_file = cache_path / CACHE_FILE
-    with open(cache_file, 'wb') as f:
-        pickle.dump({
-            'timestamp': datetime.datetime.now(),
-            'content': content
-        }, f)
+    cache_file = cache_path / CACHE_FILE.format(date=datetime.date.today().strftime("%Y%m%d"))
+    cache_file.write_text(json_dumps(data), encoding="utf-8")
 
 def load_from_cache():
-    """Load content from cache file if it exists and is from today."""
-    cache_path = Path(CACHE_DIR) / CACHE_FILE
+    """Load today's fetched source data, or None if it hasn't been saved yet."""
+    cache_path = Path(CACHE_DIR) / CACHE_FILE.format(date=datetime.date.today().strftime("%Y%m%d"))
     if not cache_path.exists():
         return None
         
     try:
-        with open(cache_path, 'rb') as f:
-            cache_data = pickle.load(f)
-            
-        # Check if cache is from today
-        cache_date = cache_data['timestamp'].date()
-        today = datetime.datetime.now().date()
-        
-        if cache_date == today:
-            return cache_data['content']
+        return json_loads(cache_path.read_bytes())
     except Exception as e:
         print(f"[WARN] Could not load cache: {e}")
     
     return None
 
+def summary_cache_key(text, *params):
+    """
+    Build the summary cache key for a text and the parameters that shape its summary
+    (model, language, max_tokens...). The text is hashed with whitespace and case
+    normalized, so trivially different copies match.
+    """
+    normalized = " ".join(text.split()).lower()
+    return hashlib.blake2b("|".join([*map(str, params), normalized]).encode("utf-8")).hexdigest()
+
+def _open_cache_db(filename, schema):
+    """Open an sqlite database in the cache directory, creating its table if needed."""
+    cache_path = Path(CACHE_DIR)
+    cache_path.mkdir(exist_ok=True)
+    
+    db = sqlite3.connect(cache_path / filename, timeout=10)
+    db.execute(schema)
+    return db
+
+def _open_summary_cache():
+    """Open the on-disk summary cache."""
+    return _open_cache_db(
+        SUMMARY_CACHE_FILE,
+        "CREATE TABLE IF NOT EXISTS summaries "
+        "(key TEXT PRIMARY KEY, summary TEXT NOT NULL, created REAL NOT NULL)"
+    )
+
+def load_cached_summary(key):
+    """Return the summary stored under key in the last SUMMARY_CACHE_TTL seconds, or None."""
+    cutoff = datetime.datetime.now().timestamp() - SUMMARY_CACHE_TTL
+    try:
+        with closing(_open_summary_cache()) as db:
+            row = db.execute(
+                "SELECT summary FROM summaries WHERE key = ? AND created >= ?",
+                (key, cutoff)
+            ).fetchone()
+        return row[0] if row else None
+    except Exception as e:
+        print(f"[WARN] Could not read summary cache: {e}")
+        return None
+
+def save_cached_summary(key, summary):
+    """Store a generated summary under key so later runs can reuse it; drops expired entries."""
+    now = datetime.datetime.now().timestamp()
+    try:
+        with closing(_open_summary_cache()) as db, db:
+            db.execute("DELETE FROM summaries WHERE created < ?", (now - SUMMARY_CACHE_TTL,))
+            db.execute(
+                "INSERT OR REPLACE INTO summaries (key, summary, created) VALUES (?, ?, ?)",
+                (key, summary, now)
+            )
+    except Exception as e:
+        print(f"[WARN] Could not write summary cache: {e}")
+
+def _open_http_cache():
+    """Open the on-disk HTTP response cache."""
+    return _open_cache_db(
+        HTTP_CACHE_FILE,
+        "CREATE TABLE IF NOT EXISTS responses "
+        "(url TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, last_modified TEXT, fetched REAL NOT NULL)"
+    )
+
+def _open_hn_story_cache():
+    """Open the on-disk cache of already processed Hacker News stories."""
+    return _open_cache_db(
+        HN_STORY_CACHE_FILE,
+        "CREATE TABLE IF NOT EXISTS stories "
+        "(id INTEGER, settings TEXT, title TEXT NOT NULL, url TEXT NOT NULL, "
+        "content_summary TEXT NOT NULL, created REAL NOT NULL, PRIMARY KEY (id, settings))"
+    )
+
+def hn_summary_settings(language=DEFAULT_LANGUAGE):
+    """
+    Return a key for the settings Hacker News stories are summarized with, so
+    cached stories are summarized again after the model, prompt or limits change.
+    """
+    return summary_cache_key(summary_system_prompt(language), SUMMARY_MODEL, language, SUMMARY_MAX_TOKENS, SUMMARY_TEMPERATURE)
+
+def load_processed_hn_stories(story_ids, language=DEFAULT_LANGUAGE):
+    """
+    Return {story_id: {"title", "url", "content_summary"}} for the given stories
+    that a previous run already summarized with the current settings.
+    Entries older than HN_STORY_CACHE_DAYS are evicted.
+    """
+    if not story_ids:
+        return {}
+    cutoff = (datetime.datetime.now() - datetime.timedelta(days=HN_STORY_CACHE_DAYS)).timestamp()
+    try:
+        with closing(_open_hn_story_cache()) as db, db:
+            db.execute("DELETE FROM stories WHERE created < ?", (cutoff,))
+            rows = db.execute(
+                f"SELECT id, title, url, content_summary FROM stories "
+                f"WHERE settings = ? AND id IN ({', '.join('?' * len(story_ids))})",
+                (hn_summary_settings(language), *story_ids)
+            ).fetchall()
+    except Exception as e:
+        print(f"[WARN] Could not read Hacker News story cache: {e}")
+        return {}
+    return {
+        story_id: {"title": title, "url": url, "content_summary": content_summary}
+        for story_id, title, url, content_summary in rows
+    }
+
+def save_processed_hn_story(story, language=DEFAULT_LANGUAGE):
+    """Remember a summarized Hacker News story so later runs can skip it."""
+    try:
+        with closing(_open_hn_story_cache()) as db, db:
+            db.execute(
+                "INSERT OR REPLACE INTO stories (id, settings, title, url, content_summary, created) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (story["id"], hn_summary_settings(language), story["title"], story["url"], story["content_summary"],
+                 datetime.datetime.now().timestamp())
+            )
+    except Exception as e:
+        print(f"[WARN] Could not write Hacker News story cache: {e}")
+
+def fetch_cached(url, ttl_seconds, timeout=HTTP_TIMEOUT):
+    """
+    GET a URL through the on-disk HTTP cache and return the response body as bytes.
+    Responses younger than ttl_seconds are returned without any network access;
+    older ones are revalidated with If-None-Match/If-Modified-Since.
+    Responses older than HTTP_CACHE_MAX_AGE are dropped when a new one is stored.
+    """
+    now = datetime.datetime.now().timestamp()
+    try:
+        with closing(_open_http_cache()) as db:
+            row = db.execute(
+                "SELECT body, etag, last_modified, fetched FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+    except Exception as e:
+        print(f"[WARN] Could not read HTTP cache: {e}")
+        row = None
+    
+    headers = {}
+    if row:
+        body, etag, last_modified, fetched = row
+        if now - fetched < ttl_seconds:
+            return body
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    
+    resp = SESSION.get(url, timeout=timeout, headers=headers)
+    if row and resp.status_code == 304:
+        etag, last_modified = row[1], row[2]
+    else:
+        resp.raise_for_status()
+        body = resp.content
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+    
+    try:
+        with closing(_open_http_cache()) as db, db:
+            # Search URLs change with every ranking window, so old rows would pile up
+            db.execute("DELETE FROM responses WHERE fetched < ?", (now - HTTP_CACHE_MAX_AGE,))
+            db.execute(
+                "INSERT OR REPLACE INTO responses (url, body, etag, last_modified, fetched) VALUES (?, ?, ?, ?, ?)",
+                (url, body, etag, last_modified, now)
+            )
+    except Exception as e:
+        print(f"[WARN] Could not write HTTP cache: {e}")
+    return body
+
+def fetch_json_cached(url, ttl_seconds, timeout=HTTP_TIMEOUT):
+    """Like fetch_cached, but decode the body as JSON."""
+    return json_loads(fetch_cached(url, ttl_seconds, timeout))
+
 # ------------------------------------------------------
 # OPTIONAL: OPENAI SUMMARIZATION
 # ------------------------------------------------------
-def summarize_text_with_openai(text, max_tokens=SUMMARY_MAX_TOKENS, temperature=SUMMARY_TEMPERATURE, language=DEFAULT_LANGUAGE):
+_openai_client = None
+_openai_client_lock = threading.Lock()
+_openai_semaphore = threading.Semaphore(OPENAI_MAX_CONCURRENCY)
+
+def get_openai_client():
     """
-    Summarize a given text using OpenAI GPT-4 API.
-    Returns an engaging newspaper-style summary in the specified language.
+    Return the shared OpenAI client, creating it on first use.
+    Reusing one client keeps a single connection pool for every API call of the run.
     """
-    from openai import OpenAI
+    global _openai_client
+    with _openai_client_lock:
+        if _openai_client is None:
+            import httpx
+            from openai import OpenAI, DefaultHttpxClient
+            _openai_client = OpenAI(
+                api_key=OPENAI_API_KEY,
+                timeout=httpx.Timeout(OPENAI_TIMEOUT, connect=5.0),
+                http_client=DefaultHttpxClient(
+                    # Multiplex concurrent calls over one connection when h2 is installed
+                    http2=importlib.util.find_spec("h2") is not None,
+                    limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+                )
+            )
+        return _openai_client
+
+def _retry_delay(error, retries):
+    """
+    Return how long to wait before retrying a failed API call: the server's
+    Retry-After when it sends a usable one, otherwise exponential backoff
+    with jitter, so calls that failed together don't all retry together.
+    """
+    response = getattr(error, "response", None)
+    headers = response.headers if response is not None else {}
+    try:
+        if "retry-after-ms" in headers:
+            delay = float(headers["retry-after-ms"]) / 1000
+        elif "retry-after" in headers:
+            value = headers["retry-after"]
+            try:
+                delay = float(value)
+            except ValueError:
+                retry_at = email.utils.parsedate_to_datetime(value)
+                delay = (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+        else:
+            delay = None
+    except (TypeError, ValueError):
+        delay = None
+    if delay is not None and 0 < delay <= OPENAI_MAX_RETRY_AFTER:
+        return delay
+    return OPENAI_RETRY_DELAY * 2 ** retries * random.uniform(0.75, 1.25)
 
-    client = OpenAI(api_key=OPENAI_API_KEY)
-    if not OPENAI_API_KEY or not text.strip():
+def _call_with_fallback(request, kwargs):
+    """
+    Run request(client, **kwargs) while holding the API semaphore.
+    Rate limits, server and connection errors are retried after _retry_delay(),
+    up to OPENAI_MAX_RETRIES times. A timeout, including a stream that stalls
+    partway through, is not retried on the same model: the request is made once
+    more with OPENAI_FALLBACK_MODEL, so one stalled call can't hold up the newspaper.
+    """
+    import httpx
+    from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+
+    # Retries are done here rather than by the SDK, which would retry timeouts too
+    client = get_openai_client().with_options(max_retries=0)
+    fell_back = False
+    retries = 0
+    while True:
+        try:
+            with _openai_semaphore:
+                return request(client, **kwargs)
+        except (APITimeoutError, httpx.TimeoutException):
+            if fell_back:
+                raise
+            fell_back = True
+            print(f"[WARN] {kwargs.get('model')} timed out, retrying with {OPENAI_FALLBACK_MODEL}")
+            kwargs = {**kwargs, "model": OPENAI_FALLBACK_MODEL}
+        except (RateLimitError, InternalServerError, APIConnectionError) as e:
+            if retries >= OPENAI_MAX_RETRIES:
+                raise
+            # The semaphore is released while waiting, so other calls can go ahead
+            time.sleep(_retry_delay(e, retries))
+            retries += 1
+
+def create_chat_completion(**kwargs):
+    """
+    Create a chat completion with the shared client.
+    Sources are fetched in parallel, so a semaphore caps how many API calls run
+    at once to stay clear of OpenAI rate limits.
+    """
+    return _call_with_fallback(lambda client, **kwargs: client.chat.completions.create(**kwargs), kwargs)
+
+def stream_chat_completion(stop_when=None, **kwargs):
+    """
+    Stream a chat completion and return its text.
+    Tokens are accumulated as they arrive; if `stop_when(text)` returns True the
+    stream is closed early so the model stops generating what we won't use.
+    """
+    def read_stream(client, **kwargs):
+        parts = []
+        stream = client.chat.completions.create(stream=True, **kwargs)
+        try:
+            for chunk in stream:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                parts.append(chunk.choices[0].delta.content)
+                if stop_when is not None and stop_when("".join(parts)):
+                    break
+        finally:
+            stream.close()
+        return "".join(parts).strip()
+
+    return _call_with_fallback(read_stream, kwargs)
+
+def summary_system_prompt(language=DEFAULT_LANGUAGE):
+    """Return the newspaper editor system prompt shared by all summary calls."""
+    return f"""You are an experienced newspaper editor who writes concise, impactful summaries.
+                Write in {language}.
+                Focus on the key points and maintain journalistic style.
+                Be concise but ensure all important information is included.
+                Keep each summary to one or two short paragraphs, about 100 words at most."""
+
+@functools.cache
+def _token_encoding():
+    """Return the tiktoken encoding for SUMMARY_MODEL, or None if tiktoken is unavailable."""
+    try:
+        import tiktoken
+        return tiktoken.encoding_for_model(SUMMARY_MODEL)
+    except Exception:
+        return None
+
+def truncate_to_tokens(text, max_tokens):
+    """
+    Cut text to at most max_tokens model tokens.
+    Uses tiktoken when installed, otherwise approximates with ~4 characters per token.
+    """
+    encoding = _token_encoding()
+    if encoding is None:
+        return text[:max_tokens * 4]
+    # Article text can contain special token markers such as <|endoftext|>;
+    # they are counted as plain text instead of raising ValueError
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
         return text
+    return encoding.decode(tokens[:max_tokens])
+
+def needs_summary(text):
+    """Return True if the text is long enough to be worth summarizing."""
+    return len(text) >= SUMMARY_MIN_CHARS and len(text.split()) >= SUMMARY_MIN_WORDS
+
+def summarize_text_with_openai(text, max_tokens=SUMMARY_MAX_TOKENS, temperature=SUMMARY_TEMPERATURE, language=DEFAULT_LANGUAGE, model=SUMMARY_MODEL):
+    """
+    Summarize a given text using the OpenAI API.
+    Returns an engaging newspaper-style summary in the specified language.
+    """
+    if not OPENAI_API_KEY or not needs_summary(text):
+        return text
+
+    cache_key = summary_cache_key(text, model, language, max_tokens, temperature)
+    cached = load_cached_summary(cache_key)
+    if cached:
+        return cached
 
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
+        summary = stream_chat_completion(
+            model=model,
             messages=[{
                 "role": "system",
-                "content": f"""You are an experienced newspaper editor who writes concise, impactful summaries.
-                Write in {language}.
-                Focus on the key points and maintain journalistic style.
-                Be concise but ensure all important information is included.
-                Aim for 2-3 short paragraphs maximum."""
+                "content": summary_system_prompt(language)
             },
             {
                 "role": "user",
                 "content": f"Write a concise newspaper summary of this article. Focus on the most newsworthy elements:\n\n{text}"
             }],
-            max_tokens=max_tokens,
+            max_completion_tokens=max_tokens,
             temperature=temperature,
         )
-        summary = response.choices[0].message.content.strip()
+        save_cached_summary(cache_key, summary)
         return summary
     except Exception as e:
         print(f"[WARN] Could not summarize with OpenAI: {e}")
         return text
 
+def summarize_texts_with_openai(texts, max_tokens=SUMMARY_MAX_TOKENS, temperature=SUMMARY_TEMPERATURE, language=DEFAULT_LANGUAGE, model=SUMMARY_MODEL):
+    """
+    Summarize several texts with a single OpenAI API call.
+    Returns a list of summaries in the same order as the input texts.
+    Falls back to one call per text if the batched response can't be used.
+    """
+    if not OPENAI_API_KEY:
+        return list(texts)
+
+    # Only send texts that are worth summarizing and weren't summarized by a
+    # previous run; short ones are returned as-is
+    summaries = list(texts)
+    indices = []
+    for i, text in enumerate(texts):
+        if not needs_summary(text):
+            continue
+        cached = load_cached_summary(summary_cache_key(text, model, language, max_tokens, temperature))
+        if cached:
+            summaries[i] = cached
+        else:
+            indices.append(i)
+    if not indices:
+        return summaries
+    if len(indices) == 1:
+        summaries[indices[0]] = summarize_text_with_openai(texts[indices[0]], max_tokens, temperature, language, model)
+        return summaries
+
+    articles = json_dumps([{"id": i, "text": texts[i]} for i in indices])
+
+    # Summaries are matched back by id, so a reply that skips or garbles some
+    # articles still saves the rest; only the missing ones are retried
+    missing = set(indices)
+    try:
+        response = create_chat_completion(
+            model=model,
+            messages=[{
+                "role": "system",
+                "content": summary_system_prompt(language)
+            },
+            {
+                "role": "user",
+                "content": f"""Write a concise newspaper summary of each of the following {len(indices)} articles. Focus on the most newsworthy elements.
+                The articles are given as a JSON array of {{"id", "text"}} objects.
+                Reply with a JSON object of the form {{"summaries": [{{"id": <article id>, "summary": "..."}}, ...]}}, with one summary per article:\n\n{articles}"""
+            }],
+            max_completion_tokens=max_tokens * len(indices),
+            temperature=temperature,
+            response_format={"type": "json_object"},
+        )
+        for item in json_loads(response.choices[0].message.content)["summaries"]:
+            i = int(item.get("id", -1))
+            summary = str(item.get("summary") or "").strip()
+            if i in missing and summary:
+                summaries[i] = summary
+                save_cached_summary(summary_cache_key(texts[i], model, language, max_tokens, temperature), summary)
+                missing.discard(i)
+    except Exception as e:
+        print(f"[WARN] Could not batch summarize with OpenAI: {e}")
+
+    if missing:
+        print(f"[WARN] Batch summary missed {len(missing)} of {len(indices)} texts, summarizing them one by one")
+        for i in sorted(missing):
+            summaries[i] = summarize_text_with_openai(texts[i], max_tokens, temperature, language, model)
+    return summaries
+
 # ------------------------------------------------------
 # DATA FETCHING FUNCTIONS
 # ------------------------------------------------------
+def fetch_hackernews_item(story_id):
+    """
+    Fetch a single Hacker News item, returning its JSON data or None on failure.
+    """
+    try:
+        return fetch_json_cached(HN_ITEM_URL.format(story_id), HN_ITEM_TTL)
+    except Exception as e:
+        print(f"[WARN] Could not fetch Hacker News item {story_id}: {e}")
+        return None
+
+def fetch_hackernews_items(story_ids):
+    """
+    Fetch several Hacker News stories with a single Algolia search request.
+    Returns {story_id: {"title": ..., "url": ...}}; stories missing from the
+    result (or all of them, if the search fails) are left out.
+    """
+    tags = "story,(" + ",".join(f"story_{story_id}" for story_id in story_ids) + ")"
+    try:
+        data = fetch_json_cached(f"{HN_SEARCH_URL}?tags={tags}&hitsPerPage={len(story_ids)}", HN_ITEM_TTL)
+        return {
+            int(hit["objectID"]): {"title": hit.get("title") or "", "url": hit.get("url")}
+            for hit in data.get("hits", [])
+        }
+    except Exception as e:
+        print(f"[WARN] Hacker News search failed, fetching stories one by one: {e}")
+        return {}
+
+def extract_main_text(html, remove_tags=NON_CONTENT_TAGS, separator=" "):
+    """
+    Return the visible text of an HTML page (str or bytes), without the content
+    of `remove_tags` (scripts, styles and page chrome by default).
+    Text chunks are joined with `separator`, a space by default.
+    """
+    if USE_SELECTOLAX:
+        from selectolax.lexbor import LexborHTMLParser
+
+        # Lexbor reads bytes as UTF-8 whatever the page declares, so decode them first
+        if isinstance(html, bytes):
+            html = decode_html(html, "")
+        # Same extraction with selectolax's C (Lexbor) parser, many times faster
+        tree = LexborHTMLParser(html)
+        tree.strip_tags(remove_tags)
+        text = tree.root.text() if tree.root else ""
+    else:
+        from bs4 import BeautifulSoup
+
+        # Use BeautifulSoup to extract article content
+        soup = BeautifulSoup(html, HTML_PARSER)
+        
+        # Remove script and style elements
+        for script in soup(remove_tags):
+            script.decompose()
+        
+        # Get text content
+        text = soup.get_text()
+    
+    # Line breaks and double spaces delimit the text chunks; collapse each
+    # whitespace run holding one into a single separator
+    return TEXT_BREAK_RE.sub(separator, text).strip()
+
+def decode_html(body, content_type):
+    """
+    Decode an HTML body with the charset declared in its Content-Type header.
+    Without one (or with an unknown one) the encoding is read from the page
+    itself (<meta charset>, byte order mark), as BeautifulSoup does.
+    """
+    charset = content_type.lower().partition("charset=")[2].split(";")[0].strip(" \"'")
+    if charset:
+        try:
+            return body.decode(charset, errors="replace")
+        except LookupError:
+            pass
+    from bs4.dammit import UnicodeDammit
+
+    # Lexbor and trafilatura don't honor <meta charset>, so they are given text
+    markup = UnicodeDammit(body, is_html=True).unicode_markup
+    return markup if markup is not None else body.decode("utf-8", errors="replace")
+
+def clean_article_text(text):
+    """
+    Drop the boilerplate left in extracted article text with one paragraph per
+    line, as trafilatura returns it, before it is sent for summarization: URLs,
+    repeated lines, and short lines that don't end a sentence, such as menus,
+    buttons and share links.
+    Returns the remaining text as a single line.
+    """
+    lines = []
+    for line in URL_RE.sub("", text).splitlines():
+        line = line.strip()
+        if len(line) < ARTICLE_MIN_LINE_CHARS and not line.endswith(SENTENCE_ENDINGS):
+            continue
+        if not lines or line != lines[-1]:
+            lines.append(line)
+    return " ".join(lines)
+
+def article_text_from_html(html):
+    """
+    Return the text of an article page to summarize, as a single line.
+    """
+    if USE_TRAFILATURA:
+        import trafilatura
+
+        # Main-content extraction leaves out menus, related links and
+        # comments, so fewer tokens are sent for the summary
+        text = trafilatura.extract(html, include_comments=False, include_tables=False)
+        if text:
+            return clean_article_text(text)
+    # Line breaks in the page text come from the HTML source and can fall in the
+    # middle of a paragraph, so short lines can't be told from boilerplate here
+    return URL_RE.sub("", extract_main_text(html)).strip()
+
+def fetch_article_text(url):
+    """
+    Fetch an article page and return its visible text content.
+    Returns an empty string if the page could not be fetched or parsed.
+    """
+    try:
+        with SESSION.get(url, timeout=HTTP_TIMEOUT, stream=True) as article_response:
+            article_response.raise_for_status()
+            
+            # Skip binary documents (PDFs, images...) that have no text to extract
+            content_type = article_response.headers.get("Content-Type", "text/html")
+            if not content_type.startswith(("text/", "application/xhtml")):
+                print(f"[WARN] Skipping non-HTML article ({content_type}): {url}")
+                return ""
+            
+            # Only download the start of the page, the article text is well within it
+            html = article_response.raw.read(ARTICLE_MAX_BYTES, decode_content=True)
+        
+        return article_text_from_html(decode_html(html, content_type))
+    except Exception as e:
+        print(f"[WARN] Could not fetch/process article content: {e}")
+        return ""
+
+def fetch_hackernews_story(story_id, previous=None, story_data=None):
+    """
+    Fetch a Hacker News story and the text of the article it links to.
+    `story_data` is the story's item when it was already fetched in bulk.
+    Returns (title, url, text), with text None when `previous` (the entry saved
+    by an earlier run) still has the same title and can be reused.
+    Returns None for stories without a title or an external article.
+    """
+    story_data = story_data or fetch_hackernews_item(story_id)
+    if not story_data:
+        return None
+    
+    title = story_data.get("title", "").strip()
+    url = story_data.get("url") or f"https://news.ycombinator.com/item?id={story_id}"
+    
+    # Skip if no title or no external article to analyze
+    if not title or url.startswith("https://news.ycombinator.com"):
+        return None
+    if previous and previous["title"] == title:
+        return title, url, None
+    return title, url, fetch_article_text(url)
+
 def fetch_hackernews_top_stories(limit=5, language=DEFAULT_LANGUAGE):
     """
     Fetch top stories from Hacker News and summarize their content.
@@ -256,73 +886,71 @@ def fetch_hackernews_top_stories(limit=5, language=DEFAULT_LANGUAGE):
     """
     result = []
     try:
-        r = requests.get(HN_TOP_STORIES_URL, timeout=10)
-        r.raise_for_status()
-        top_ids = r.json()
+        # Only consider the top of the ranking, so a run where most articles
+        # fail doesn't go on to fetch all ~500 stories
+        candidate_ids = fetch_json_cached(HN_TOP_STORIES_URL, HN_TOP_STORIES_TTL)[:limit * HN_CANDIDATE_FACTOR]
+        window_size = limit * 2
+        windows = [candidate_ids[start:start + window_size] for start in range(0, len(candidate_ids), window_size)]
         
-        for story_id in top_ids:  # Remove limit here to process more if some fail
-            if len(result) >= limit:  # Check if we have enough successful articles
-                break
+        # Not used as a context manager: once enough stories are in, slow article
+        # fetches further down the ranking are abandoned instead of waited for
+        executor = ThreadPoolExecutor(max_workers=HN_WORKERS)
+        try:
+            # Walk the ranking in windows, fetching each window's items and articles
+            # concurrently; later windows only run to replace stories that failed
+            for window in windows:
+                if len(result) >= limit:  # Check if we have enough successful articles
+                    break
                 
-            # Fetch story details
-            story_url = f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"
-            s = requests.get(story_url, timeout=10)
-            s.raise_for_status()
-            story_data = s.json()
-            
-            title = story_data.get("title", "").strip()
-            url = story_data.get("url") or f"https://news.ycombinator.com/item?id={story_id}"
-            
-            # Skip if no title
-            if not title:
-                continue
-            
-            # Fetch and analyze content if there's a URL
-            content_summary = ""
-            if url and not url.startswith("https://news.ycombinator.com"):
-                try:
-                    # Use a browser-like User-Agent
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                    }
-                    article_response = requests.get(url, timeout=10, headers=headers)
-                    article_response.raise_for_status()
-                    
-                    # Use BeautifulSoup to extract article content
-                    soup = BeautifulSoup(article_response.text, 'html.parser')
-                    
-                    # Remove script and style elements
-                    for script in soup(["script", "style", "nav", "header", "footer", "aside"]):
-                        script.decompose()
-                    
-                    # Get text content
-                    text = soup.get_text()
-                    
-                    # Break into lines and remove leading/trailing space
-                    lines = (line.strip() for line in text.splitlines())
-                    # Break multi-headlines into a line each
-                    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                    # Drop blank lines
-                    text = ' '.join(chunk for chunk in chunks if chunk)
-                    
-                    # Verify we have meaningful content
-                    if len(text) > 200:  # Minimum content length threshold
-                        content_summary = summarize_text_with_openai(
-                            text[:8000],
-                            language=language
-                        )
-                        # Only add to results if we got a summary
-                        if content_summary.strip():
-                            result.append({
-                                "title": title,
-                                "url": url,
-                                "content_summary": content_summary
-                            })
-                    else:
+                # Stories processed by a recent run are reused as-is; the window's
+                # items come from one search request, and each worker fetches a
+                # story's article only if it's new (and its item if search missed it)
+                processed = load_processed_hn_stories(window, language)
+                items = fetch_hackernews_items(window)
+                futures = [
+                    executor.submit(fetch_hackernews_story, story_id, processed.get(story_id), items.get(story_id))
+                    for story_id in window
+                ]
+                
+                # Keep only stories with meaningful text, in ranking order, and
+                # stop waiting as soon as the best-ranked ones are enough
+                candidates = []
+                for story_id, future in zip(window, futures):
+                    if len(candidates) >= limit - len(result):
+                        break
+                    story = future.result()
+                    if story is None:
+                        continue
+                    title, url, text = story
+                    if text is None:
+                        candidates.append({"id": story_id, **processed[story_id]})
+                    elif len(text) > 200:  # Minimum content length threshold
+                        candidates.append({"id": story_id, "title": title, "url": url, "text": truncate_to_tokens(text, HN_MAX_INPUT_TOKENS)})
+                    elif text:
                         print(f"[WARN] Article content too short or invalid for: {url}")
-                        
-                except Exception as e:
-                    print(f"[WARN] Could not fetch/process article content: {e}")
+                
+                # Summarize the new candidates in a single batched call
+                new_candidates = [candidate for candidate in candidates if "text" in candidate]
+                summaries = summarize_texts_with_openai(
+                    [candidate["text"] for candidate in new_candidates],
+                    language=language
+                )
+                for candidate, content_summary in zip(new_candidates, summaries):
+                    candidate["content_summary"] = content_summary
+                    # Remember real summaries only, not the raw text returned on failure
+                    if content_summary != candidate["text"]:
+                        save_processed_hn_story(candidate, language)
+                
+                for candidate in candidates:
+                    # Only add to results if we got a summary
+                    if candidate["content_summary"].strip():
+                        result.append({
+                            "title": candidate["title"],
+                            "url": candidate["url"],
+                            "content_summary": candidate["content_summary"]
+                        })
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
             
     except Exception as e:
         print(f"[ERROR] Hacker News fetch error: {e}")
@@ -332,20 +960,26 @@ def fetch_rss_headlines(feed_url, limit=5, language=DEFAULT_LANGUAGE):
     """
     Fetch headlines and content from an RSS feed, returning a list of dicts with 'title', 'description'.
     """
+    import feedparser
+
     items = []
     try:
-        feed = feedparser.parse(feed_url)
-        for entry in feed.entries[:limit]:
-            title = entry.title
-            # Get the full description/content
-            content = entry.description if hasattr(entry, 'description') else ''
-            
-            # If we have OpenAI enabled, summarize the content
-            if USE_OPENAI_SUMMARY and content:
-                content = summarize_text_with_openai(content, language=language)
-            
+        # An unchanged feed comes back as 304 and is served from the HTTP cache
+        feed = feedparser.parse(fetch_cached(feed_url, RSS_TTL))
+        entries = feed.entries[:limit]
+        # Get the full description/content
+        contents = [entry.get("description") or entry.get("summary", "") for entry in entries]
+        
+        # If we have OpenAI enabled, summarize all the content in one call
+        if USE_OPENAI_SUMMARY:
+            contents = summarize_texts_with_openai(
+                [truncate_to_tokens(content, RSS_MAX_INPUT_TOKENS) for content in contents],
+                language=language
+            )
+        
+        for entry, content in zip(entries, contents):
             items.append({
-                "title": title,
+                "title": entry.title,
                 "content": content
             })
     except Exception as e:
@@ -357,29 +991,13 @@ def fetch_weather(city_url):
     Fetch weather data from Open-Meteo API, returning a string description.
     """
     try:
-        resp = requests.get(city_url, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
+        data = fetch_json_cached(city_url, WEATHER_TTL)
         
         if "current" in data:
             temp = data["current"]["temperature_2m"]
             weather_code = data["current"]["weather_code"]
             
-            # WMO Weather interpretation codes (https://open-meteo.com/en/docs)
-            weather_descriptions = {
-                0: "Clear sky",
-                1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
-                45: "Foggy", 48: "Depositing rime fog",
-                51: "Light drizzle", 53: "Moderate drizzle", 55: "Dense drizzle",
-                61: "Slight rain", 63: "Moderate rain", 65: "Heavy rain",
-                71: "Slight snow", 73: "Moderate snow", 75: "Heavy snow",
-                77: "Snow grains",
-                80: "Slight rain showers", 81: "Moderate rain showers", 82: "Violent rain showers",
-                85: "Slight snow showers", 86: "Heavy snow showers",
-                95: "Thunderstorm", 96: "Thunderstorm with hail", 99: "Thunderstorm with heavy hail"
-            }
-            
-            desc = weather_descriptions.get(weather_code, "Unknown conditions")
+            desc = WEATHER_DESCRIPTIONS.get(weather_code, "Unknown conditions")
             return f"Weather in {CITY_NAME}: {temp}°C, {desc}"
         else:
             return "Weather data not found."
@@ -393,39 +1011,37 @@ def fetch_rts_news(limit=5, language=DEFAULT_LANGUAGE):
     items = []
     try:
         # Fetch the main page
-        response = requests.get(RTS_URL, timeout=10)
+        response = SESSION.get(RTS_URL, timeout=HTTP_TIMEOUT)
         response.raise_for_status()
         
-        # Parse HTML
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Convert HTML to plain text for better processing
-        h = html2text.HTML2Text()
-        h.ignore_links = True
-        h.ignore_images = True
-        page_text = h.handle(str(soup))
-        
-        # Use AI to identify and extract top stories
-        from openai import OpenAI
-        client = OpenAI(api_key=OPENAI_API_KEY)
+        # Reduce the page to plain text for better processing, one headline or
+        # paragraph per line; navigation is kept since it can hold top stories
+        html = decode_html(response.content, response.headers.get("Content-Type", ""))
+        page_text = extract_main_text(html, remove_tags=["script", "style"], separator="\n")
         
-        # First, let AI identify the most important stories
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{
-                "role": "system",
-                "content": f"You are a news editor for RTS. Analyze the webpage content and identify the {limit} most important news stories. Focus on actual news articles, not TV shows or programs. Return the results in a structured format with title and content clearly separated."
-            },
-            {
-                "role": "user",
-                "content": f"Here's the RTS webpage content. Identify the {limit} most important news stories, extracting their titles and content. Format your response as 'TITLE: xxx\nCONTENT: yyy' for each story:\n\n{page_text}"
-            }],
-            max_tokens=1000,
-            temperature=0.3
-        )
+        # Use AI to identify and extract the most important stories; the result
+        # is cached per page content, so a re-run on an unchanged page is free
+        cache_key = summary_cache_key(page_text, OPENAI_MODEL, "rts", limit)
+        stories_text = load_cached_summary(cache_key)
+        if not stories_text:
+            # Once a story beyond the limit starts, the ones before it are complete
+            stories_text = stream_chat_completion(
+                stop_when=lambda text: text.count("TITLE:") > limit,
+                model=OPENAI_MODEL,
+                messages=[{
+                    "role": "system",
+                    "content": f"You are a news editor for RTS. Analyze the webpage content and identify the {limit} most important news stories. Focus on actual news articles, not TV shows or programs. Return the results in a structured format with title and content clearly separated."
+                },
+                {
+                    "role": "user",
+                    "content": f"Here's the RTS webpage content. Identify the {limit} most important news stories, extracting their titles and content. Format your response as 'TITLE: xxx\nCONTENT: yyy' for each story:\n\n{page_text}"
+                }],
+                max_completion_tokens=1000,
+                temperature=0.3
+            )
+            save_cached_summary(cache_key, stories_text)
         
         # Parse AI response and extract stories
-        stories_text = response.choices[0].message.content.strip()
         story_blocks = stories_text.split('\n\n')
         
         for block in story_blocks:
@@ -443,50 +1059,83 @@ def fetch_rts_news(limit=5, language=DEFAULT_LANGUAGE):
                     content = line.replace("CONTENT:", "").strip()
             
             if title and content:
-                # Summarize the content in the target language
-                summary = summarize_text_with_openai(content, language=language)
                 items.append({
                     "title": title,
-                    "content": summary
+                    "content": content
                 })
                 
             if len(items) >= limit:
                 break
+        
+        # Summarize all the stories in the target language in one call
+        summaries = summarize_texts_with_openai([item["content"] for item in items], language=language)
+        for item, summary in zip(items, summaries):
+            item["content"] = summary
                 
     except Exception as e:
         print(f"[ERROR] RTS fetch error: {e}")
     
     return items
 
-def fetch_random_quote(language=DEFAULT_LANGUAGE):
+def translate_quote_locally(quote, author, language):
     """
-    Fetch a random quote from ZenQuotes API and translate if needed.
+    Translate an English quote offline with Argos Translate.
+    Returns the translation as '"quote" - author', like the OpenAI translation,
+    or None if Argos or its model for `language` is not installed.
+    """
+    code = ARGOS_LANGUAGE_CODES.get(language.lower())
+    if not USE_ARGOS_TRANSLATE or code is None:
+        return None
+    try:
+        from argostranslate import translate
+
+        # Listing the installed packages doesn't load the translation models
+        installed = {lang.code: lang for lang in translate.get_installed_languages()}
+        if "en" not in installed or code not in installed:
+            return None
+        translation = installed["en"].get_translation(installed[code])
+        if translation is None:
+            return None
+        return f'"{translation.translate(quote)}" - {author}'
+    except Exception as e:
+        print(f"[WARN] Could not translate quote locally: {e}")
+        return None
+
+def fetch_random_quote(language=DEFAULT_LANGUAGE, model=SUMMARY_MODEL):
+    """
+    Pick a random quote from the ZenQuotes batch and translate if needed.
+    The batch is cached on disk for a week, so most runs make no quote request.
     Falls back to predefined list if the API fails.
     """
     try:
         # First try the ZenQuotes API
-        response = requests.get(ZENQUOTES_API_URL, timeout=5)
-        response.raise_for_status()
-        quote_data = response.json()[0]  # API returns array with single quote
+        quote_data = random.choice(json_loads(fetch_cached(ZENQUOTES_API_URL, ZENQUOTES_TTL, timeout=(3.05, 5))))
         
         # If not in target language, translate it
         if language.lower() != "english":
-            from openai import OpenAI
-            client = OpenAI(api_key=OPENAI_API_KEY)
-            
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{
-                    "role": "system",
-                    "content": f"You are a professional translator specializing in literary and philosophical texts. Translate this quote to {language}, maintaining its poetic and impactful nature while ensuring it sounds natural."
-                },
-                {
-                    "role": "user",
-                    "content": f'Translate this quote and author name with elegance: "{quote_data["q"]}" - {quote_data["a"]}'
-                }],
-                temperature=0.7
-            )
-            translated = response.choices[0].message.content.strip()
+            # Translations are cached, the weekly batch keeps offering the same quotes;
+            # a local translation, when available, saves the API call altogether
+            cache_key = summary_cache_key(f'{quote_data["q"]} - {quote_data["a"]}', model, language, "quote")
+            translated = load_cached_summary(cache_key)
+            if not translated:
+                translated = translate_quote_locally(quote_data["q"], quote_data["a"], language)
+                if translated:
+                    save_cached_summary(cache_key, translated)
+            if not translated:
+                translated = stream_chat_completion(
+                    model=model,
+                    messages=[{
+                        "role": "system",
+                        "content": f"You are a professional translator specializing in literary and philosophical texts. Translate this quote to {language}, maintaining its poetic and impactful nature while ensuring it sounds natural."
+                    },
+                    {
+                        "role": "user",
+                        "content": f'Translate this quote and author name with elegance: "{quote_data["q"]}" - {quote_data["a"]}'
+                    }],
+                    max_completion_tokens=SHORT_REPLY_MAX_TOKENS,
+                    temperature=0.7
+                )
+                save_cached_summary(cache_key, translated)
             
             # Split the translation back into quote and author
             if " - " in translated:
@@ -522,12 +1171,9 @@ def fetch_daily_boost(language=DEFAULT_LANGUAGE):
     }
     
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=OPENAI_API_KEY)
-        
         # Generate a motivational quote using AI
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
+        boost_content["motivation"] = stream_chat_completion(
+            model=OPENAI_MODEL,
             messages=[{
                 "role": "system",
                 "content": f"""You are a wise philosopher and motivational speaker who creates impactful quotes in {language}.
@@ -538,15 +1184,15 @@ def fetch_daily_boost(language=DEFAULT_LANGUAGE):
             },
             {
                 "role": "user",
-                "content": f"Create an original motivational quote about {random.choice(['success', 'perseverance', 'growth', 'wisdom', 'courage', 'creativity', 'happiness', 'inner peace'])}"
+                "content": f"Create an original motivational quote about {random.choice(MOTIVATION_TOPICS)}"
             }],
+            max_completion_tokens=SHORT_REPLY_MAX_TOKENS,
             temperature=0.9
         )
-        boost_content["motivation"] = response.choices[0].message.content.strip()
         
         # Generate a personalized goal/intention
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
+        boost_content["goal"] = stream_chat_completion(
+            model=OPENAI_MODEL,
             messages=[{
                 "role": "system",
                 "content": f"""You are a life coach who creates personalized, actionable daily intentions in {language}.
@@ -558,9 +1204,9 @@ def fetch_daily_boost(language=DEFAULT_LANGUAGE):
                 "role": "user",
                 "content": "Create a powerful daily intention that encourages personal growth and positive action."
             }],
+            max_completion_tokens=SHORT_REPLY_MAX_TOKENS,
             temperature=0.8
         )
-        boost_content["goal"] = response.choices[0].message.content.strip()
         
     except Exception as e:
         print(f"[WARN] Could not generate some motivation content: {e}")
@@ -571,149 +1217,60 @@ def fetch_daily_boost(language=DEFAULT_LANGUAGE):
 # PDF GENERATION
 # ------------------------------------------------------
 # Create a shared canvas class for both test and main documents
-class PageCountCanvas(canvas.Canvas):
-    def __init__(self, *args, **kwargs):
-        canvas.Canvas.__init__(self, *args, **kwargs)
-        self._current_page = 1  # Start at 1 instead of 0
+@functools.cache
+def page_count_canvas():
+    """Return the PageCountCanvas class, defined on first use to defer importing reportlab."""
+    from reportlab.pdfgen import canvas
 
-    def showPage(self):
-        canvas.Canvas.showPage(self)
-        self._current_page += 1  # Increment after showing the page
+    class PageCountCanvas(canvas.Canvas):
+        def __init__(self, *args, **kwargs):
+            canvas.Canvas.__init__(self, *args, **kwargs)
+            self._current_page = 1  # Start at 1 instead of 0
 
-    def save(self):
-        canvas.Canvas.save(self)
+        def showPage(self):
+            canvas.Canvas.showPage(self)
+            self._current_page += 1  # Increment after showing the page
 
-def calculate_content_size(doc, content, styles):
-    """
-    Calculate the approximate size of content with current styles.
-    Returns the number of pages it would take.
-    """
-    from reportlab.platypus.doctemplate import FrameBreak, PageBreak
-    from reportlab.platypus.paragraph import Paragraph
-    
-    # Create a temporary document to measure content
-    class SizeDocTemplate(BaseDocTemplate):
-        def __init__(self):
-            super().__init__("size_test.pdf", pagesize=A4)
-            self.page_count = 0
-            
-        def handle_pageBegin(self):
-            self.page_count += 1
-            super().handle_pageBegin()
+        def save(self):
+            canvas.Canvas.save(self)
 
-        def handle_pageEnd(self):
-            super().handle_pageEnd()
-    
-    doc_test = SizeDocTemplate()
-    doc_test.addPageTemplates(doc.pageTemplates)
-    
-    # Build flowables with current styles
-    flowables = []
-    current_section = None
-    
-    for text in content:
-        if not text.strip():
-            continue
-            
-        has_emoji = any(ord(char) > 0x1F300 for char in text)
-        style_to_use = styles["emoji_style"] if has_emoji else styles["article_style"]
-            
-        if text.isupper() and "-" in text:
-            if text == "CITATION DU JOUR":
-                flowables.append(Paragraph(text, styles["quote_section_style"]))
-            else:
-                flowables.append(Paragraph(text, styles["section_header_style"]))
-            current_section = text
-        elif current_section == "CITATION DU JOUR":
-            if text.startswith("❝") or text.startswith("«"):
-                flowables.append(Paragraph(text, styles["quote_style"]))
-            elif text.startswith("—") or text.startswith("-"):
-                flowables.append(Paragraph(text, styles["attribution_style"]))
-        elif text.strip().split('.')[0].isdigit():
-            flowables.append(Paragraph(text, styles["article_title_style"]))
-        else:
-            flowables.append(Paragraph(text, style_to_use))
-    
-    # Add a spacer at the end to ensure content fills all pages
-    flowables.append(Spacer(1, 1))
-    
-    # Build document to count pages
-    doc_test.build(flowables, canvasmaker=PageCountCanvas)
-    return doc_test.page_count
+    return PageCountCanvas
+
+@functools.cache
+def register_emoji_font():
+    """Register emoji font if available (once per run)."""
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    try:
+        # Try different possible paths for the Noto Color Emoji font
+        emoji_font_paths = [
+            "/System/Library/Fonts/Apple Color Emoji.ttc",  # macOS
+            "/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf",  # Linux
+            "C:/Windows/Fonts/seguiemj.ttf",  # Windows
+        ]
+        
+        for font_path in emoji_font_paths:
+            if os.path.exists(font_path):
+                pdfmetrics.registerFont(TTFont('EmojiFont', font_path))
+                break
+    except Exception as e:
+        print(f"[WARN] Could not register emoji font: {e}")
 
-def build_newspaper_pdf(pdf_filename, story_content, target_pages=2):
+@functools.cache
+def base_paragraph_styles():
     """
-    Generate a multi-column PDF (A4) with an old-school newspaper style.
-    Dynamically adjusts font sizes to fit content within the specified number of pages.
+    Build the newspaper paragraph styles once per run, deferring the reportlab import.
+    Also registers the emoji font that emoji_style refers to.
     """
-    page_width, page_height = A4
-    
-    # Convert 5mm to points (reportlab uses points)
-    margin = 0.5 * cm  # 5mm = 0.5cm
-    footer_height = 1 * cm  # Height for the footer
-    
-    class NumberedDocTemplate(BaseDocTemplate):
-        def __init__(self, *args, **kwargs):
-            BaseDocTemplate.__init__(self, *args, **kwargs)
-            self.current_page = 0
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 
-        def handle_pageBegin(self):
-            self.current_page += 1
-            super().handle_pageBegin()
-    
-    doc = NumberedDocTemplate(
-        pdf_filename,
-        pagesize=A4,
-        leftMargin=margin,
-        rightMargin=margin,
-        topMargin=margin,
-        bottomMargin=margin + footer_height,  # Add space for footer
-    )
-    
-    def footer(canvas, doc):
-        canvas.saveState()
-        # Get current date in French format
-        try:
-            date_str = format_date(datetime.datetime.now(), format="dd/MM/yyyy", locale='fr')
-        except:
-            date_str = datetime.datetime.now().strftime("%d/%m/%Y")
-            
-        footer_text = f"Morning Press - {date_str} - Page {canvas._current_page} of {target_pages}"
-        canvas.setFont("Times-Roman", 8)
-        canvas.drawCentredString(page_width/2, margin/2, footer_text)
-        canvas.restoreState()
-    
-    gutter = 0.3 * cm  # Reduced gutter to match smaller margins
-    column_width = (page_width - 2 * margin - 2 * gutter) / 3
-    
-    # Define frames for the content
-    content_frames = [
-        Frame(
-            doc.leftMargin + i * (column_width + gutter),
-            doc.bottomMargin,
-            column_width,
-            page_height - doc.topMargin - doc.bottomMargin,
-            leftPadding=0,
-            bottomPadding=0,
-            rightPadding=0,
-            topPadding=0,
-            showBoundary=0
-        )
-        for i in range(3)
-    ]
-    
-    # Create page template with footer
-    page_template = PageTemplate(
-        id="ThreeColumns",
-        frames=content_frames,
-        onPage=footer
-    )
-    doc.addPageTemplates([page_template])
-    
+    register_emoji_font()
     styles = getSampleStyleSheet()
     
     # Define initial styles with default sizes
-    style_definitions = {
+    return {
         "masthead_style": ParagraphStyle(
             "Masthead",
             parent=styles["Title"],
@@ -821,6 +1378,146 @@ def build_newspaper_pdf(pdf_filename, story_content, target_pages=2):
             textColor=colors.black
         )
     }
+
+def paragraph_styles():
+    """Return fresh copies of the newspaper styles, which build_newspaper_pdf rescales in place."""
+    return {name: style.clone(style.name) for name, style in base_paragraph_styles().items()}
+
+def format_french_date(date, babel_format, strftime_format):
+    """Format a date in French with babel, falling back to strftime and the current locale."""
+    from babel.dates import format_date
+
+    try:
+        return format_date(date, format=babel_format, locale='fr')
+    except Exception:
+        return date.strftime(strftime_format)
+
+def build_content_flowables(content, styles):
+    """
+    Turn the (kind, text) content items into styled Paragraph flowables.
+    Each kind names its style, e.g. "article_title" uses article_title_style.
+    Shared by the page-count estimate and the final PDF build.
+    """
+    from reportlab.platypus import Paragraph
+
+    flowables = []
+    for kind, text in content:
+        if kind == "article" and EMOJI_RE.search(text):
+            kind = "emoji"
+        flowables.append(Paragraph(text, styles[f"{kind}_style"]))
+    return flowables
+
+def calculate_content_size(doc, content, styles):
+    """
+    Calculate the approximate size of content with current styles.
+    Returns the number of pages it would take.
+    """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import BaseDocTemplate, Spacer
+    
+    # Create a temporary document to measure content, built in memory since
+    # only its page count is needed
+    class SizeDocTemplate(BaseDocTemplate):
+        def __init__(self):
+            super().__init__(io.BytesIO(), pagesize=A4)
+            self.page_count = 0
+            
+        def handle_pageBegin(self):
+            self.page_count += 1
+            super().handle_pageBegin()
+
+        def handle_pageEnd(self):
+            super().handle_pageEnd()
+    
+    doc_test = SizeDocTemplate()
+    doc_test.addPageTemplates(doc.pageTemplates)
+    
+    # Build flowables with current styles
+    flowables = build_content_flowables(content, styles)
+    
+    # Add a spacer at the end to ensure content fills all pages
+    flowables.append(Spacer(1, 1))
+    
+    # Build document to count pages
+    doc_test.build(flowables, canvasmaker=page_count_canvas())
+    return doc_test.page_count
+
+def build_newspaper_pdf(pdf_filename, story_content, target_pages=2, date=None):
+    """
+    Generate a multi-column PDF (A4) with an old-school newspaper style.
+    Dynamically adjusts font sizes to fit content within the specified number of pages.
+    :param pdf_filename: Output path, or a writable file object such as PrintTee
+    :param date: Edition date shown in the masthead and footer (default: now)
+    """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import cm
+    from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer
+
+    if date is None:
+        date = datetime.datetime.now()
+    
+    page_width, page_height = A4
+    
+    # Convert 5mm to points (reportlab uses points)
+    margin = 0.5 * cm  # 5mm = 0.5cm
+    footer_height = 1 * cm  # Height for the footer
+    
+    class NumberedDocTemplate(BaseDocTemplate):
+        def __init__(self, *args, **kwargs):
+            BaseDocTemplate.__init__(self, *args, **kwargs)
+            self.current_page = 0
+
+        def handle_pageBegin(self):
+            self.current_page += 1
+            super().handle_pageBegin()
+    
+    doc = NumberedDocTemplate(
+        pdf_filename,
+        pagesize=A4,
+        leftMargin=margin,
+        rightMargin=margin,
+        topMargin=margin,
+        bottomMargin=margin + footer_height,  # Add space for footer
+    )
+    
+    # The edition date is the same on every page, so format it once up front
+    footer_date = format_french_date(date, "dd/MM/yyyy", "%d/%m/%Y")
+    
+    def footer(canvas, doc):
+        canvas.saveState()
+        footer_text = f"Morning Press - {footer_date} - Page {canvas._current_page} of {target_pages}"
+        canvas.setFont("Times-Roman", 8)
+        canvas.drawCentredString(page_width/2, margin/2, footer_text)
+        canvas.restoreState()
+    
+    gutter = 0.3 * cm  # Reduced gutter to match smaller margins
+    column_width = (page_width - 2 * margin - 2 * gutter) / 3
+    
+    # Define frames for the content
+    content_frames = [
+        Frame(
+            doc.leftMargin + i * (column_width + gutter),
+            doc.bottomMargin,
+            column_width,
+            page_height - doc.topMargin - doc.bottomMargin,
+            leftPadding=0,
+            bottomPadding=0,
+            rightPadding=0,
+            topPadding=0,
+            showBoundary=0
+        )
+        for i in range(3)
+    ]
+    
+    # Create page template with footer
+    page_template = PageTemplate(
+        id="ThreeColumns",
+        frames=content_frames,
+        onPage=footer
+    )
+    doc.addPageTemplates([page_template])
+    
+    style_definitions = paragraph_styles()
     
     # Calculate initial content size
     num_pages = calculate_content_size(doc, story_content, style_definitions)
@@ -859,64 +1556,164 @@ def build_newspaper_pdf(pdf_filename, story_content, target_pages=2):
     flowables = []
     
     # Add masthead
-    try:
-        date_str = format_date(datetime.datetime.now(), format="EEEE d MMMM yyyy", locale='fr')
-    except:
-        date_str = datetime.datetime.now().strftime("%A %d %B %Y")
+    date_str = format_french_date(date, "EEEE d MMMM yyyy", "%A %d %B %Y")
     flowables.append(Paragraph("Morning Press", style_definitions["masthead_style"]))
     flowables.append(Paragraph(date_str, style_definitions["subtitle_style"]))
     
     # Process content with appropriate styles
-    current_section = None
-    
-    for text in story_content:
-        if not text.strip():
-            continue
-            
-        has_emoji = any(ord(char) > 0x1F300 for char in text)
-        style_to_use = style_definitions["emoji_style"] if has_emoji else style_definitions["article_style"]
-            
-        if text.isupper() and "-" in text:
-            if text == "CITATION DU JOUR":
-                flowables.append(Paragraph(text, style_definitions["quote_section_style"]))
-            else:
-                flowables.append(Paragraph(text, style_definitions["section_header_style"]))
-            current_section = text
-        elif current_section == "CITATION DU JOUR":
-            if text.startswith("❝") or text.startswith("«"):
-                flowables.append(Paragraph(text, style_definitions["quote_style"]))
-            elif text.startswith("—") or text.startswith("-"):
-                flowables.append(Paragraph(text, style_definitions["attribution_style"]))
-        elif text.strip().split('.')[0].isdigit():  # Check if starts with any number followed by a period
-            flowables.append(Paragraph(text, style_definitions["article_title_style"]))
-        else:
-            flowables.append(Paragraph(text, style_to_use))
+    flowables.extend(build_content_flowables(story_content, style_definitions))
     
     # Add a spacer at the end to ensure content fills all pages
     flowables.append(Spacer(1, 1))
     
     # Build the PDF with our custom canvas
-    doc.build(flowables, canvasmaker=PageCountCanvas)
-
-def print_pdf(pdf_filename, printer_name=""):
-    """Print the PDF file using the 'lpr' command."""
-    if not os.path.exists(pdf_filename):
-        print(f"[ERROR] PDF file not found: {pdf_filename}")
-        return
+    doc.build(flowables, canvasmaker=page_count_canvas())
 
-    print_cmd = ["lpr", pdf_filename]
+def start_print_job(printer_name=""):
+    """
+    Start an 'lpr' job that reads the PDF from its standard input.
+    Returns the running process, or None on failure.
+    """
+    print_cmd = ["lpr"]
     if printer_name:
-        print_cmd = ["lpr", "-P", printer_name, pdf_filename]
+        print_cmd = ["lpr", "-P", printer_name]
 
     try:
-        subprocess.run(print_cmd, check=True)
-        print(f"Sent {pdf_filename} to printer '{printer_name or 'default'}'.")
+        return subprocess.Popen(print_cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL)
     except Exception as e:
         print(f"[ERROR] Printing file: {e}")
+        return None
+
+class PrintTee:
+    """
+    File-like object for reportlab that writes the PDF to a file and,
+    at the same time, streams it into a print job started with start_print_job.
+    """
+    def __init__(self, file, print_job=None):
+        self.file = file
+        self.name = file.name  # reportlab reads the output name from here
+        self.print_job = print_job
+
+    def write(self, data):
+        self.file.write(data)
+        if self.print_job is not None:
+            try:
+                self.print_job.stdin.write(data)
+            except OSError as e:
+                print(f"[ERROR] Printing file: {e}")
+                self.print_job = None
+
+    def flush(self):
+        self.file.flush()
+
+    def finish_print_job(self):
+        """Close the print job's input so lpr submits it; returns the job or None."""
+        if self.print_job is None:
+            return None
+        try:
+            self.print_job.stdin.close()
+        except OSError as e:
+            print(f"[ERROR] Printing file: {e}")
+        return self.print_job
 
 # ------------------------------------------------------
 # MAIN
 # ------------------------------------------------------
+def fetch_sources(num_articles=MAX_ITEMS, language=DEFAULT_LANGUAGE):
+    """
+    Fetch every source of the newspaper.
+    Returns a JSON-serializable dict of the raw data, laid out by build_content.
+    """
+    # Sources are independent and I/O-bound, so fetch them all concurrently
+    executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS)
+    print("Fetching Le Temps news...")
+    le_temps_future = executor.submit(fetch_rss_headlines, LE_TEMPS_RSS, num_articles, language)
+    print("Fetching RTS news...")
+    rts_future = executor.submit(fetch_rts_news, num_articles, language)
+    print("Fetching Hacker News stories...")
+    hn_future = executor.submit(fetch_hackernews_top_stories, num_articles, language)
+    print("Fetching quote of the day...")
+    quote_future = executor.submit(fetch_random_quote, language)
+    weather_future = executor.submit(fetch_weather, WEATHER_URL)
+    print("Preparing daily boost...")
+    boost_future = executor.submit(fetch_daily_boost, language)
+    executor.shutdown(wait=False)
+    
+    return {
+        "weather": weather_future.result(),
+        "le_temps_news": le_temps_future.result(),
+        "rts_news": rts_future.result(),
+        "hn_news": hn_future.result(),
+        "quote_data": quote_future.result(),
+        "boost_data": boost_future.result(),
+    }
+
+def build_content(data):
+    """
+    Lay out the fetched source data as (kind, text) newspaper content items.
+    """
+    content = []
+    
+    # Add weather
+    content.append(("article", data["weather"]))
+    
+    # Process Le Temps news
+    le_temps_news = data["le_temps_news"]
+    
+    if le_temps_news:
+        content.append(("section_header", "LE TEMPS - TOP STORIES"))
+        content.append(("article", SECTION_SEPARATOR))
+        for idx, item in enumerate(le_temps_news, 1):
+            content.append(("article_title", f"{idx}. {item['title']}"))
+            if item.get('content'):
+                content.append(("article", item['content']))
+    
+    # Process RTS news
+    rts_news = data["rts_news"]
+    
+    if rts_news:
+        content.append(("section_header", "RTS - TOP STORIES"))
+        content.append(("article", SECTION_SEPARATOR))
+        for idx, item in enumerate(rts_news, 1):
+            content.append(("article_title", f"{idx}. {item['title']}"))
+            if item.get('content'):
+                content.append(("article", item['content']))
+    
+    # Process Hacker News stories
+    hn_news = data["hn_news"]
+    
+    if hn_news:
+        content.append(("section_header", "HACKER NEWS - TOP STORIES"))
+        content.append(("article", SECTION_SEPARATOR))
+        for idx, item in enumerate(hn_news, 1):
+            content.append(("article_title", f"{idx}. {item['title']}"))
+            if item.get('content_summary'):
+                content.append(("article", item['content_summary']))
+    
+    # Add quote of the day
+    quote_data = data["quote_data"]
+    if quote_data:
+        content.append(("quote_section", "CITATION DU JOUR - TOP QUOTES"))
+        content.append(("article", SECTION_SEPARATOR))
+        content.append(("quote", f"« {quote_data['quote']} »"))
+        content.append(("attribution", f"— {quote_data['author']}"))
+    
+    # Add daily boost
+    boost_data = data["boost_data"]
+    if boost_data:
+        content.append(("section_header", "BOOST DU JOUR - TOP MOTIVATION"))
+        content.append(("article", SECTION_SEPARATOR))
+        content.append(("article", "✧ Affirmation du jour:"))
+        content.append(("article", boost_data["affirmation"]))
+        if boost_data.get("motivation"):
+            content.append(("article", "★ Pensée motivante:"))
+            content.append(("article", boost_data["motivation"]))
+        if boost_data.get("goal"):
+            content.append(("article", "⟡ Intention du jour:"))
+            content.append(("article", boost_data["goal"]))
+    
+    return content
+
 def main(use_cache=False, auto_print=False, articles_per_source=None, target_pages=2):
     """
     Main function to generate the morning press.
@@ -932,103 +1729,39 @@ def main(use_cache=False, auto_print=False, articles_per_source=None, target_pag
     num_articles = articles_per_source if articles_per_source is not None else MAX_ITEMS
 
     # Generate unique filename with timestamp
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     pdf_filename = f"press/{PDF_PREFIX}_{timestamp}.pdf"
 
     # Try to load from cache if use_cache is True
-    content = None
+    data = None
     if use_cache:
-        content = load_from_cache()
-        if content:
+        data = load_from_cache()
+        if data:
             print("Using cached content...")
     
     # If no cache or cache disabled, fetch fresh content
-    if content is None:
-        content = []
-        
-        # Add weather
-        weather_info = fetch_weather(WEATHER_URL)
-        content.append(weather_info)
-        content.append("")  # Add spacing
-        
-        # Fetch and process Le Temps news
-        print("Fetching Le Temps news...")
-        le_temps_news = fetch_rss_headlines(LE_TEMPS_RSS, num_articles, DEFAULT_LANGUAGE)
-        
-        if le_temps_news:
-            content.append("LE TEMPS - TOP STORIES")
-            content.append(SECTION_SEPARATOR)
-            for idx, item in enumerate(le_temps_news, 1):
-                content.append(f"{idx}. {item['title']}")
-                if item.get('content'):
-                    content.append("")
-                    content.append(item['content'])
-                content.append("")
-        
-        # Fetch and process RTS news
-        print("Fetching RTS news...")
-        rts_news = fetch_rts_news(num_articles, DEFAULT_LANGUAGE)
-        
-        if rts_news:
-            content.append("RTS - TOP STORIES")
-            content.append(SECTION_SEPARATOR)
-            for idx, item in enumerate(rts_news, 1):
-                content.append(f"{idx}. {item['title']}")
-                if item.get('content'):
-                    content.append("")
-                    content.append(item['content'])
-                content.append("")
-        
-        # Fetch and process Hacker News stories
-        print("Fetching Hacker News stories...")
-        hn_news = fetch_hackernews_top_stories(num_articles, DEFAULT_LANGUAGE)
-        
-        if hn_news:
-            content.append("HACKER NEWS - TOP STORIES")
-            content.append(SECTION_SEPARATOR)
-            for idx, item in enumerate(hn_news, 1):
-                content.append(f"{idx}. {item['title']}")
-                if item.get('content_summary'):
-                    content.append("")
-                    content.append(item['content_summary'])
-                content.append("")
-        
-        # Add quote of the day
-        print("Fetching quote of the day...")
-        quote_data = fetch_random_quote(DEFAULT_LANGUAGE)
-        if quote_data:
-            content.append("CITATION DU JOUR - TOP QUOTES")
-            content.append(SECTION_SEPARATOR)
-            content.append(f"« {quote_data['quote']} »")
-            content.append(f"— {quote_data['author']}")
-        
-        # Add daily boost
-        print("Preparing daily boost...")
-        boost_data = fetch_daily_boost(DEFAULT_LANGUAGE)
-        if boost_data:
-            content.append("BOOST DU JOUR - TOP MOTIVATION")
-            content.append(SECTION_SEPARATOR)
-            content.append("✧ Affirmation du jour:")
-            content.append(boost_data["affirmation"])
-            content.append("")
-            if boost_data.get("motivation"):
-                content.append("★ Pensée motivante:")
-                content.append(boost_data["motivation"])
-                content.append("")
-            if boost_data.get("goal"):
-                content.append("⟡ Intention du jour:")
-                content.append(boost_data["goal"])
-            content.append("")
+    if data is None:
+        data = fetch_sources(num_articles)
         
         # Save to cache for future use
-        save_to_cache(content)
-    
-    # Generate PDF
-    build_newspaper_pdf(pdf_filename, content, target_pages)
+        save_to_cache(data)
+    content = build_content(data)
     
-    # Print if auto_print is True or printer name is configured
+    # Print if auto_print is True or printer name is configured: lpr is started
+    # before the PDF is built, so its startup overlaps with the layout work, and
+    # receives the PDF as it is written instead of re-reading the file afterwards
+    print_job = None
     if auto_print or PRINTER_NAME:
-        print_pdf(pdf_filename, PRINTER_NAME)
+        print_job = start_print_job(PRINTER_NAME)
+    
+    # Generate PDF
+    with open(pdf_filename, "wb") as pdf_file:
+        output = PrintTee(pdf_file, print_job)
+        build_newspaper_pdf(output, content, target_pages, now)
+    print_job = output.finish_print_job()
+    if print_job is not None:
+        print(f"Sent {pdf_filename} to printer '{PRINTER_NAME or 'default'}'.")
     
     print(f"Morning Press generated: {pdf_filename}")
 
@@ -1052,6 +1785,10 @@ def main(use_cache=False, auto_print=False, articles_per_source=None, target_pag
         else:
             print("Please answer 'y' or 'n'")
 
+    # Report the outcome of the print job, which ran while the user was answering
+    if print_job is not None and print_job.wait() != 0:
+        print(f"[ERROR] Printing file: lpr exited with status {print_job.returncode}")
+
 # ------------------------------------------------------
 if __name__ == "__main__":
     # Parse command line arguments
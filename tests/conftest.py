@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# daily_newspaper.py is a script at the repository root, not an installed package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,46 @@
+import daily_newspaper
+
+
+WRAPPED_PARAGRAPH = """<html><body>
+<p>
+ The government announced on Tuesday
+ that the new budget would include
+ significant changes to taxation.
+</p>
+</body></html>"""
+
+
+def test_wrapped_paragraph_is_kept_without_trafilatura(monkeypatch):
+    monkeypatch.setattr(daily_newspaper, "USE_TRAFILATURA", False)
+
+    text = daily_newspaper.article_text_from_html(WRAPPED_PARAGRAPH)
+
+    assert text == (
+        "The government announced on Tuesday that the new budget would include "
+        "significant changes to taxation."
+    )
+
+
+def test_urls_are_stripped_without_trafilatura(monkeypatch):
+    monkeypatch.setattr(daily_newspaper, "USE_TRAFILATURA", False)
+
+    text = daily_newspaper.article_text_from_html("<p>Read more at https://example.com/a today.</p>")
+
+    assert text == "Read more at today."
+
+
+def test_clean_article_text_drops_boilerplate_paragraphs():
+    text = "\n".join([
+        "Home",
+        "Share",
+        "The government announced on Tuesday that the new budget would include changes.",
+        "The government announced on Tuesday that the new budget would include changes.",
+        "It passed.",
+        "See https://example.com/budget for the full text of the budget proposal",
+    ])
+
+    assert daily_newspaper.clean_article_text(text) == (
+        "The government announced on Tuesday that the new budget would include changes. "
+        "It passed. "
+        "See for the full text of the budget proposal"
+    )
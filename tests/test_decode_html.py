@@ -0,0 +1,23 @@
+import pytest
+
+import daily_newspaper
+
+
+LATIN1_PAGE = '<html><head><meta charset="iso-8859-1"></head><body><p>Café</p></body></html>'.encode("latin-1")
+
+
+def test_header_charset_is_used():
+    assert daily_newspaper.decode_html("Café".encode("utf-8"), "text/html; charset=UTF-8") == "Café"
+
+
+def test_meta_charset_is_used_without_header_charset():
+    assert "Café" in daily_newspaper.decode_html(LATIN1_PAGE, "text/html")
+
+
+@pytest.mark.parametrize("use_selectolax", [False, True])
+def test_parsers_read_meta_charset_alike(monkeypatch, use_selectolax):
+    if use_selectolax:
+        pytest.importorskip("selectolax")
+    monkeypatch.setattr(daily_newspaper, "USE_SELECTOLAX", use_selectolax)
+
+    assert daily_newspaper.extract_main_text(LATIN1_PAGE) == "Café"
@@ -0,0 +1,38 @@
+import pytest
+
+import daily_newspaper
+
+
+STORY = {"id": 1, "title": "A story", "url": "https://example.com/", "content_summary": "A summary."}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(daily_newspaper, "CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_story_is_reused_with_same_settings():
+    daily_newspaper.save_processed_hn_story(STORY)
+
+    assert daily_newspaper.load_processed_hn_stories([1]) == {
+        1: {"title": "A story", "url": "https://example.com/", "content_summary": "A summary."}
+    }
+
+
+@pytest.mark.parametrize("setting, value", [
+    ("SUMMARY_MODEL", "another-model"),
+    ("SUMMARY_MAX_TOKENS", 50),
+    ("SUMMARY_TEMPERATURE", 1.0),
+])
+def test_story_is_summarized_again_after_settings_change(monkeypatch, setting, value):
+    daily_newspaper.save_processed_hn_story(STORY)
+    monkeypatch.setattr(daily_newspaper, setting, value)
+
+    assert daily_newspaper.load_processed_hn_stories([1]) == {}
+
+
+def test_story_is_summarized_again_in_another_language():
+    daily_newspaper.save_processed_hn_story(STORY, language="French")
+
+    assert daily_newspaper.load_processed_hn_stories([1], language="English") == {}
@@ -0,0 +1,66 @@
+import sqlite3
+
+import pytest
+
+import daily_newspaper
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    """Serve queued responses to fetch_cached and record the request headers."""
+    monkeypatch.setattr(daily_newspaper, "CACHE_DIR", str(tmp_path))
+    responses = []
+    requests = []
+
+    def get(url, timeout, headers):
+        requests.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(daily_newspaper.SESSION, "get", get)
+    return responses, requests
+
+
+def test_fresh_response_is_served_from_cache(server):
+    responses, requests = server
+    responses.append(FakeResponse(200, b"body"))
+
+    assert daily_newspaper.fetch_cached("https://example.com/", 60) == b"body"
+    assert daily_newspaper.fetch_cached("https://example.com/", 60) == b"body"
+    assert len(requests) == 1
+
+
+def test_stale_response_is_revalidated(server):
+    responses, requests = server
+    responses.append(FakeResponse(200, b"body", {"ETag": '"v1"', "Last-Modified": "Mon, 12 Oct 2026 08:00:00 GMT"}))
+    responses.append(FakeResponse(304))
+
+    daily_newspaper.fetch_cached("https://example.com/", 0)
+
+    assert daily_newspaper.fetch_cached("https://example.com/", 0) == b"body"
+    assert requests[1] == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 12 Oct 2026 08:00:00 GMT"}
+
+
+def test_old_responses_are_pruned(server, tmp_path):
+    responses, _ = server
+    responses.append(FakeResponse(200, b"old"))
+    responses.append(FakeResponse(200, b"new"))
+    daily_newspaper.fetch_cached("https://example.com/old", 60)
+    with sqlite3.connect(tmp_path / daily_newspaper.HTTP_CACHE_FILE) as db:
+        db.execute("UPDATE responses SET fetched = fetched - ?", (daily_newspaper.HTTP_CACHE_MAX_AGE + 1,))
+
+    daily_newspaper.fetch_cached("https://example.com/new", 60)
+
+    with sqlite3.connect(tmp_path / daily_newspaper.HTTP_CACHE_FILE) as db:
+        urls = [url for (url,) in db.execute("SELECT url FROM responses")]
+    assert urls == ["https://example.com/new"]
@@ -0,0 +1,154 @@
+import sys
+import types
+
+import httpx
+import pytest
+
+import daily_newspaper
+
+
+class FakeAPIError(Exception):
+    def __init__(self, headers=None):
+        super().__init__()
+        self.response = types.SimpleNamespace(headers=headers or {})
+
+
+class FakeAPIConnectionError(Exception):
+    pass
+
+
+class FakeAPITimeoutError(FakeAPIConnectionError):
+    pass
+
+
+class FakeRateLimitError(FakeAPIError):
+    pass
+
+
+class FakeInternalServerError(FakeAPIError):
+    pass
+
+
+class FakeClient:
+    def with_options(self, **options):
+        self.options = options
+        return self
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake_openai = types.SimpleNamespace(
+        APIConnectionError=FakeAPIConnectionError,
+        APITimeoutError=FakeAPITimeoutError,
+        InternalServerError=FakeInternalServerError,
+        RateLimitError=FakeRateLimitError,
+    )
+    monkeypatch.setitem(sys.modules, "openai", fake_openai)
+    client = FakeClient()
+    monkeypatch.setattr(daily_newspaper, "get_openai_client", lambda: client)
+    monkeypatch.setattr(daily_newspaper.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(daily_newspaper, "OPENAI_FALLBACK_MODEL", "fallback")
+    return client
+
+
+def failing(*errors):
+    """
+    Return a request that raises the given errors in turn, then succeeds.
+    """
+    calls = []
+
+    def request(client, **kwargs):
+        calls.append(kwargs["model"])
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+
+    return request, calls
+
+
+def test_sdk_retries_are_disabled(client):
+    request, _ = failing()
+
+    daily_newspaper._call_with_fallback(request, {"model": "main"})
+
+    assert client.options == {"max_retries": 0}
+
+
+@pytest.mark.parametrize("error", [FakeAPITimeoutError(), httpx.ReadTimeout("stalled")])
+def test_timeout_falls_back_without_retrying_same_model(client, error):
+    request, calls = failing(error)
+
+    assert daily_newspaper._call_with_fallback(request, {"model": "main"}) == "ok"
+    assert calls == ["main", "fallback"]
+
+
+def test_timeout_falls_back_only_once(client):
+    request, calls = failing(FakeAPITimeoutError(), httpx.ReadTimeout("stalled"))
+
+    with pytest.raises(httpx.ReadTimeout):
+        daily_newspaper._call_with_fallback(request, {"model": "main"})
+    assert calls == ["main", "fallback"]
+
+
+def test_timeout_is_retried_once_when_fallback_is_same_model(client):
+    request, calls = failing(FakeAPITimeoutError())
+
+    assert daily_newspaper._call_with_fallback(request, {"model": "fallback"}) == "ok"
+    assert calls == ["fallback", "fallback"]
+
+
+def test_rate_limit_is_retried_on_same_model(client):
+    request, calls = failing(FakeRateLimitError(), FakeInternalServerError())
+
+    assert daily_newspaper._call_with_fallback(request, {"model": "main"}) == "ok"
+    assert calls == ["main", "main", "main"]
+
+
+def test_rate_limit_retries_are_bounded(client, monkeypatch):
+    monkeypatch.setattr(daily_newspaper, "OPENAI_MAX_RETRIES", 2)
+    request, calls = failing(*[FakeRateLimitError()] * 3)
+
+    with pytest.raises(FakeRateLimitError):
+        daily_newspaper._call_with_fallback(request, {"model": "main"})
+    assert len(calls) == 3
+
+
+def test_retry_after_header_is_honored(client, monkeypatch):
+    slept = []
+    monkeypatch.setattr(daily_newspaper.time, "sleep", slept.append)
+    request, _ = failing(FakeRateLimitError({"retry-after": "7"}), FakeRateLimitError({"retry-after-ms": "250"}))
+
+    daily_newspaper._call_with_fallback(request, {"model": "main"})
+
+    assert slept == [7.0, 0.25]
+
+
+def test_backoff_has_jitter(client, monkeypatch):
+    slept = []
+    monkeypatch.setattr(daily_newspaper.time, "sleep", slept.append)
+    request, _ = failing(*[FakeInternalServerError()] * 3)
+
+    daily_newspaper._call_with_fallback(request, {"model": "main"})
+
+    for retries, delay in enumerate(slept):
+        base = daily_newspaper.OPENAI_RETRY_DELAY * 2 ** retries
+        assert 0.75 * base <= delay <= 1.25 * base
+    assert len(set(slept)) == 3
+
+
+def test_semaphore_is_released_while_waiting(client, monkeypatch):
+    free_slots = []
+
+    def sleep(seconds):
+        acquired = [daily_newspaper._openai_semaphore.acquire(blocking=False)
+                    for _ in range(daily_newspaper.OPENAI_MAX_CONCURRENCY)]
+        free_slots.append(sum(acquired))
+        for _ in range(sum(acquired)):
+            daily_newspaper._openai_semaphore.release()
+
+    monkeypatch.setattr(daily_newspaper.time, "sleep", sleep)
+    request, _ = failing(FakeRateLimitError())
+
+    daily_newspaper._call_with_fallback(request, {"model": "main"})
+
+    assert free_slots == [daily_newspaper.OPENAI_MAX_CONCURRENCY]
@@ -0,0 +1,53 @@
+import sys
+import types
+
+import pytest
+
+import daily_newspaper
+
+
+QUOTE = {"q": "Well begun is half done.", "a": "Aristotle"}
+
+
+class FakeTranslation:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def translate(self, text):
+        self.calls.append(text)
+        return "Bien commencé est à moitié fait."
+
+
+class FakeLanguage:
+    def __init__(self, code, translation=None):
+        self.code = code
+        self.translation = translation
+
+    def get_translation(self, to):
+        return self.translation
+
+
+@pytest.fixture
+def argos(monkeypatch, tmp_path):
+    """Install a fake Argos Translate with an en→fr model and return its calls."""
+    calls = []
+    languages = [FakeLanguage("en", FakeTranslation(calls)), FakeLanguage("fr")]
+    translate = types.SimpleNamespace(get_installed_languages=lambda: languages)
+    monkeypatch.setitem(sys.modules, "argostranslate", types.SimpleNamespace(translate=translate))
+    monkeypatch.setattr(daily_newspaper, "USE_ARGOS_TRANSLATE", True)
+    monkeypatch.setattr(daily_newspaper, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(daily_newspaper, "fetch_cached", lambda *args, **kwargs: daily_newspaper.json_dumps([QUOTE]))
+    return calls
+
+
+def test_local_translation_is_cached(argos):
+    first = daily_newspaper.fetch_random_quote(language="French")
+    second = daily_newspaper.fetch_random_quote(language="French")
+
+    assert first == second == {"quote": "Bien commencé est à moitié fait.", "author": "Aristotle"}
+    assert len(argos) == 1
+
+
+def test_missing_language_model_is_skipped_quietly(argos, capsys):
+    assert daily_newspaper.translate_quote_locally(QUOTE["q"], QUOTE["a"], "German") is None
+    assert capsys.readouterr().out == ""
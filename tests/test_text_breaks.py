@@ -0,0 +1,24 @@
+import random
+
+import pytest
+
+import daily_newspaper
+
+
+# Letters plus every character str.splitlines() or str.strip() treats specially
+ALPHABET = "ab \t\n\r\v\f\x1c\x1d\x1e\x1f\x85\xa0  　"
+
+
+def chunked(text, separator):
+    """The line-by-line chunking TEXT_BREAK_RE replaced."""
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return separator.join(chunk for chunk in chunks if chunk)
+
+
+@pytest.mark.parametrize("separator", [" ", "\n"])
+def test_matches_line_chunking(separator):
+    rng = random.Random(0)
+    for _ in range(20000):
+        text = "".join(rng.choices(ALPHABET, k=rng.randint(0, 12)))
+        assert daily_newspaper.TEXT_BREAK_RE.sub(separator, text).strip() == chunked(text, separator), repr(text)
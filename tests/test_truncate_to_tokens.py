@@ -0,0 +1,21 @@
+import daily_newspaper
+
+
+class FakeEncoding:
+    """Character-level stand-in for a tiktoken encoding, with its special token check."""
+
+    def encode(self, text, disallowed_special="all"):
+        if disallowed_special == "all" and "<|endoftext|>" in text:
+            raise ValueError("Encountered text corresponding to disallowed special token")
+        return list(text)
+
+    def decode(self, tokens):
+        return "".join(tokens)
+
+
+def test_special_token_marker_is_plain_text(monkeypatch):
+    monkeypatch.setattr(daily_newspaper, "_token_encoding", FakeEncoding)
+    text = "Models end documents with <|endoftext|> markers."
+
+    assert daily_newspaper.truncate_to_tokens(text, 100) == text
+    assert daily_newspaper.truncate_to_tokens(text, 6) == "Models"